@@ -24,19 +24,19 @@ Supports both stdio and streamable HTTP startup modes
 
 import argparse
 import asyncio
+import functools
 import json
 import logging
+import operator
 from typing import Any
 
+import orjson
+
 from mcp.server import Server
+from mcp.server.lowlevel.server import NotificationOptions
 from mcp.server.models import InitializationOptions
 
-from mcp.types import (
-    Prompt,
-    Resource,
-    TextContent,
-    Tool,
-)
+from mcp.types import GetPromptResult, PromptMessage, TextContent
 
 from .tools.tools_manager import DorisToolsManager
 from .tools.prompts_manager import DorisPromptsManager
@@ -50,8 +50,91 @@ import os
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create a default config instance for getting default values
-_default_config = DorisConfig()
+# Command line overrides: (config attribute path, argparse dest)
+# The override is applied only when the argument differs from the default config value
+_ARG_SPECS = (
+    ("database.host", "db_host"),
+    ("database.port", "db_port"),
+    ("database.user", "db_user"),
+    ("database.database", "db_database"),
+    ("database.max_connections", "db_pool_size"),
+    ("logging.level", "log_level"),
+)
+
+
+@functools.cache
+def _get_default_config() -> DorisConfig:
+    """Default config instance for getting default values, created on first use"""
+    return DorisConfig()
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to default when unset"""
+    value = os.getenv(name)
+    return int(value) if value is not None else default
+
+
+def _pool_size(value: str) -> int:
+    """Parse --db-pool-size, resources and prompts pin a "system" connection so at least 2 are needed"""
+    size = int(value)
+    if size < 2:
+        raise argparse.ArgumentTypeError(f"pool size must be at least 2, got {size}")
+    return size
+
+
+def _set_config_value(config: DorisConfig, attr_path: str, value: Any):
+    """Set a dotted attribute path such as 'database.host' on config"""
+    parent_path, _, attr = attr_path.rpartition(".")
+    target = operator.attrgetter(parent_path)(config) if parent_path else config
+    setattr(target, attr, value)
+
+
+# Static health check payload, serialized once per process
+_HEALTH_BODY = b'{"status":"healthy","service":"doris-mcp-server"}'
+
+# Prebuilt ASGI messages for the static 404/500 responses of the HTTP app
+_NOT_FOUND_START = {
+    "type": "http.response.start",
+    "status": 404,
+    "headers": [(b"content-length", b"9"), (b"content-type", b"text/plain; charset=utf-8")],
+}
+_NOT_FOUND_BODY = {"type": "http.response.body", "body": b"Not Found"}
+_SERVER_ERROR_START = {
+    "type": "http.response.start",
+    "status": 500,
+    "headers": [(b"content-length", b"21"), (b"content-type", b"text/plain; charset=utf-8")],
+}
+_SERVER_ERROR_BODY = {"type": "http.response.body", "body": b"Internal Server Error"}
+
+
+def _json_value(value: Any) -> str:
+    """Serialize a single JSON value, non-native types (e.g. AnyUrl) fall back to str
+
+    stdlib json takes over for what orjson rejects, such as ints wider than 64 bits
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS, default=str).decode("utf-8")
+    except orjson.JSONEncodeError:
+        return json.dumps(value, ensure_ascii=False, default=str)
+
+
+# Error envelopes have a fixed shape, only the field values are serialized per error
+def _err_resource(msg: str, uri: Any) -> str:
+    return f'{{\n  "error": {_json_value(msg)},\n  "uri": {_json_value(uri)}\n}}'
+
+
+def _err_tool(msg: str, name: str, arguments: dict[str, Any]) -> str:
+    return (
+        f'{{\n  "error": {_json_value(msg)},\n  "tool_name": {_json_value(name)},'
+        f'\n  "arguments": {_json_value(arguments)}\n}}'
+    )
+
+
+def _err_prompt(msg: str, name: str, arguments: dict[str, Any]) -> str:
+    return (
+        f'{{\n  "error": {_json_value(msg)},\n  "prompt_name": {_json_value(name)},'
+        f'\n  "arguments": {_json_value(arguments)}\n}}'
+    )
 
 
 class DorisServer:
@@ -73,105 +156,85 @@ class DorisServer:
         self.prompts_manager = DorisPromptsManager(self.connection_manager)
 
         self.logger = logging.getLogger(f"{__name__}.DorisServer")
+        self._closed = False
         self._setup_handlers()
 
-    def _setup_handlers(self):
-        """Setup MCP protocol handlers"""
+        # Capabilities only depend on the registered handlers, build them once
+        # MCP 1.8.0 requires parameters for get_capabilities
+        self._notification_options = NotificationOptions(
+            prompts_changed=True,
+            resources_changed=True,
+            tools_changed=True
+        )
+        self._capabilities = self.server.get_capabilities(
+            notification_options=self._notification_options,
+            experimental_capabilities={}
+        )
+        self._init_options = InitializationOptions(
+            server_name="doris-mcp-server",
+            server_version=os.getenv("SERVER_VERSION", _get_default_config().server_version),
+            capabilities=self._capabilities,
+        )
+        # StreamableHTTPSessionManager asks the server for initialization options on every new
+        # session, hand out the cached ones so HTTP advertises the same capabilities as stdio
+        self.server.create_initialization_options = lambda: self._init_options
+
+    def _mcp_handler(self, action: str, func, fallback):
+        """Wrap a manager coroutine with the shared debug log and error shell
+
+        fallback receives the exception followed by the handler arguments and
+        builds the response returned to the client when func fails
+        """
+        logger = self.logger
+        log_debug = logger.debug
+        log_error = logger.error
 
-        @self.server.list_resources()
-        async def handle_list_resources() -> list[Resource]:
-            """Handle resource list request"""
+        @functools.wraps(func)
+        async def handler(*args):
             try:
-                self.logger.info("Handling resource list request")
-                resources = await self.resources_manager.list_resources()
-                self.logger.info(f"Returning {len(resources)} resources")
-                return resources
+                if logger.isEnabledFor(logging.DEBUG):
+                    log_debug(f"Handling {action} request: {args}")
+                return await func(*args)
             except Exception as e:
-                self.logger.error(f"Failed to handle resource list request: {e}")
-                return []
+                log_error(f"Failed to handle {action} request: {e}")
+                return fallback(e, *args)
 
-        @self.server.read_resource()
-        async def handle_read_resource(uri: str) -> str:
-            """Handle resource read request"""
-            try:
-                self.logger.info(f"Handling resource read request: {uri}")
-                content = await self.resources_manager.read_resource(uri)
-                return content
-            except Exception as e:
-                self.logger.error(f"Failed to handle resource read request: {e}")
-                return json.dumps(
-                    {"error": f"Failed to read resource: {str(e)}", "uri": uri},
-                    ensure_ascii=False,
-                    indent=2,
-                )
+        return handler
 
-        @self.server.list_tools()
-        async def handle_list_tools() -> list[Tool]:
-            """Handle tool list request"""
-            try:
-                self.logger.info("Handling tool list request")
-                tools = await self.tools_manager.list_tools()
-                self.logger.info(f"Returning {len(tools)} tools")
-                return tools
-            except Exception as e:
-                self.logger.error(f"Failed to handle tool list request: {e}")
-                return []
-
-        @self.server.call_tool()
-        async def handle_call_tool(
-            name: str, arguments: dict[str, Any]
-        ) -> list[TextContent]:
-            """Handle tool call request"""
-            try:
-                self.logger.info(f"Handling tool call request: {name}")
-                result = await self.tools_manager.call_tool(name, arguments)
+    def _setup_handlers(self):
+        """Setup MCP protocol handlers"""
 
-                return [TextContent(type="text", text=result)]
-            except Exception as e:
-                self.logger.error(f"Failed to handle tool call request: {e}")
-                error_result = json.dumps(
-                    {
-                        "error": f"Tool call failed: {str(e)}",
-                        "tool_name": name,
-                        "arguments": arguments,
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                )
+        async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+            result = await self.tools_manager.call_tool(name, arguments)
+            return [TextContent(type="text", text=result)]
 
-                return [TextContent(type="text", text=error_result)]
+        def read_resource_error(e: Exception, uri: str) -> str:
+            return _err_resource(f"Failed to read resource: {str(e)}", uri)
 
-        @self.server.list_prompts()
-        async def handle_list_prompts() -> list[Prompt]:
-            """Handle prompt list request"""
-            try:
-                self.logger.info("Handling prompt list request")
-                prompts = await self.prompts_manager.list_prompts()
-                self.logger.info(f"Returning {len(prompts)} prompts")
-                return prompts
-            except Exception as e:
-                self.logger.error(f"Failed to handle prompt list request: {e}")
-                return []
+        def call_tool_error(e: Exception, name: str, arguments: dict[str, Any]) -> list[TextContent]:
+            error_result = _err_tool(f"Tool call failed: {str(e)}", name, arguments)
+            return [TextContent(type="text", text=error_result)]
 
-        @self.server.get_prompt()
-        async def handle_get_prompt(name: str, arguments: dict[str, Any]) -> str:
-            """Handle prompt get request"""
-            try:
-                self.logger.info(f"Handling prompt get request: {name}")
-                result = await self.prompts_manager.get_prompt(name, arguments)
-                return result
-            except Exception as e:
-                self.logger.error(f"Failed to handle prompt get request: {e}")
-                error_result = json.dumps(
-                    {
-                        "error": f"Failed to get prompt: {str(e)}",
-                        "prompt_name": name,
-                        "arguments": arguments,
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                )
-                return error_result
+        def get_prompt_error(e: Exception, name: str, arguments: dict[str, Any]) -> GetPromptResult:
+            error_result = _err_prompt(f"Failed to get prompt: {str(e)}", name, arguments)
+            return GetPromptResult(
+                messages=[PromptMessage(role="user", content=TextContent(type="text", text=error_result))]
+            )
+
+        def empty_list(e: Exception) -> list:
+            return []
+
+        # MCP registration decorator -> (action name, handler coroutine, error fallback)
+        handlers = {
+            self.server.list_resources: ("resource list", self.resources_manager.list_resources, empty_list),
+            self.server.read_resource: ("resource read", self.resources_manager.read_resource, read_resource_error),
+            self.server.list_tools: ("tool list", self.tools_manager.list_tools, empty_list),
+            self.server.call_tool: ("tool call", call_tool, call_tool_error),
+            self.server.list_prompts: ("prompt list", self.prompts_manager.list_prompts, empty_list),
+            self.server.get_prompt: ("prompt get", self.prompts_manager.get_prompt, get_prompt_error),
+        }
+        for register, (action, func, fallback) in handlers.items():
+            register()(self._mcp_handler(action, func, fallback))
 
     async def start_stdio(self):
         """Start stdio transport mode"""
@@ -193,46 +256,19 @@ class DorisServer:
                     read_stream, write_stream = streams
                     self.logger.info("stdio_server streams created successfully")
                     
-                    # Create initialization options
-                    # MCP 1.8.0 requires parameters for get_capabilities
-                    from mcp.server.lowlevel.server import NotificationOptions
-                    
-                    capabilities = self.server.get_capabilities(
-                        notification_options=NotificationOptions(
-                            prompts_changed=True,
-                            resources_changed=True,
-                            tools_changed=True
-                        ),
-                        experimental_capabilities={}
-                    )
-                    
-                    init_options = InitializationOptions(
-                        server_name="doris-mcp-server",
-                        server_version=os.getenv("SERVER_VERSION", _default_config.server_version),
-                        capabilities=capabilities,
-                    )
-                    self.logger.info("Initialization options created successfully")
-                    
-                    # Run server
+                    # Run server with initialization options prepared in __init__
                     self.logger.info("Starting to run MCP server...")
-                    await self.server.run(read_stream, write_stream, init_options)
+                    await self.server.run(read_stream, write_stream, self._init_options)
                     
-            except Exception as inner_e:
-                self.logger.error(f"stdio_server internal error: {inner_e}")
-                self.logger.error(f"Error type: {type(inner_e)}")
-                
-                # Try to get more error information
-                import traceback
-                self.logger.error("Complete error stack:")
-                self.logger.error(traceback.format_exc())
-                
-                # If it's ExceptionGroup, try to parse
-                if hasattr(inner_e, 'exceptions'):
-                    self.logger.error(f"ExceptionGroup contains {len(inner_e.exceptions)} exceptions:")
-                    for i, exc in enumerate(inner_e.exceptions):
-                        self.logger.error(f"  Exception {i+1}: {type(exc).__name__}: {exc}")
-                
-                raise inner_e
+            except* Exception as eg:
+                # Task group failures arrive as an ExceptionGroup, log each sub-exception with its stack
+                self.logger.error(f"stdio_server internal error: {len(eg.exceptions)} exception(s)")
+                for sub in eg.exceptions:
+                    self.logger.exception(f"stdio_server sub-error: {type(sub).__name__}: {sub}", exc_info=sub)
+                # A bare raise here would wrap a lone failure in ExceptionGroup, re-raise it as itself
+                if len(eg.exceptions) == 1 and not isinstance(eg.exceptions[0], BaseExceptionGroup):
+                    raise eg.exceptions[0] from eg.exceptions[0].__cause__
+                raise
                 
         except Exception as e:
             self.logger.error(f"stdio server startup failed: {e}")
@@ -241,8 +277,11 @@ class DorisServer:
 
 
 
-    async def start_http(self, host: str = os.getenv("SERVER_HOST", _default_config.database.host), port: int = os.getenv("SERVER_PORT", _default_config.server_port)):
+    async def start_http(self, host: str | None = None, port: int | None = None, workers: int = 1):
         """Start Streamable HTTP transport mode"""
+        # Resolve defaults at call time - priority: arguments > environment variables > configuration
+        host = host or os.getenv("SERVER_HOST") or self.config.database.host
+        port = port or _env_int("SERVER_PORT", self.config.server_port)
         self.logger.info(f"Starting Doris MCP Server (Streamable HTTP mode) - {host}:{port}")
 
         try:
@@ -256,7 +295,7 @@ class DorisServer:
             from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
             from starlette.applications import Starlette
             from starlette.routing import Route
-            from starlette.responses import JSONResponse, Response
+            from starlette.responses import Response
             from starlette.types import Scope
             
             # Create session manager
@@ -268,9 +307,11 @@ class DorisServer:
             
             self.logger.info(f"StreamableHTTP session manager created, will start at http://{host}:{port}")
             
-            # Health check endpoint
+            # Health check endpoint - the response is static, so build it once and reuse it
+            health_response = Response(content=_HEALTH_BODY, media_type="application/json")
+
             async def health_check(request):
-                return JSONResponse({"status": "healthy", "service": "doris-mcp-server"})
+                return health_response
             
             # Lifecycle manager - simplified since we manage session_manager externally
             @contextlib.asynccontextmanager
@@ -293,102 +334,114 @@ class DorisServer:
             
             # Custom ASGI app that handles both /mcp and /mcp/ without redirects
             async def mcp_app(scope, receive, send):
-                # Handle lifespan events
-                if scope["type"] == "lifespan":
+                scope_type = scope["type"]
+                if scope_type != "http":
+                    # Handle lifespan events
+                    if scope_type == "lifespan":
+                        await starlette_app(scope, receive, send)
+                    else:
+                        # For other scope types, just return
+                        self.logger.warning(f"Unsupported scope type: {scope_type}")
+                    return
+
+                path = scope["path"]
+                debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+                if debug_enabled:
+                    self.logger.debug(f"Received request for path: {path}")
+
+                # Handle health check
+                if path.startswith("/health"):
                     await starlette_app(scope, receive, send)
                     return
-                
-                # Handle HTTP requests
-                if scope["type"] == "http":
-                    path = scope.get("path", "")
-                    self.logger.info(f"Received request for path: {path}")
-                    
-                    try:
-                        # Handle health check
-                        if path.startswith("/health"):
-                            await starlette_app(scope, receive, send)
-                            return
-                        
-                        # Handle MCP requests - both /mcp and /mcp/ go to session manager
-                        if path == "/mcp" or path.startswith("/mcp/"):
-                            self.logger.info(f"Handling MCP request for path: {path}")
-                            # Log request details for debugging
-                            method = scope.get("method", "UNKNOWN")
-                            headers = dict(scope.get("headers", []))
-                            self.logger.info(f"MCP Request - Method: {method}")
-                            self.logger.info(f"MCP Request - Headers: {headers}")
-                            
-                            # Handle Dify compatibility for GET requests
-                            if method == "GET":
-                                accept_header = headers.get(b'accept', b'').decode('utf-8')
-                                user_agent = headers.get(b'user-agent', b'').decode('utf-8')
-                                
-
-                                
-                                # For other GET requests, try to add application/json to Accept header
-                                if 'text/event-stream' in accept_header and 'application/json' not in accept_header:
-                                    self.logger.info("Adding application/json to Accept header for GET request")
-                                    # Modify headers to include both content types
-                                    new_headers = []
-                                    for name, value in scope.get("headers", []):
-                                        if name == b'accept':
-                                            # Add application/json to the accept header
-                                            new_value = value.decode('utf-8') + ', application/json'
-                                            new_headers.append((name, new_value.encode('utf-8')))
-                                        else:
-                                            new_headers.append((name, value))
-                                    # Update scope with modified headers
-                                    scope = dict(scope)
-                                    scope["headers"] = new_headers
-                                    self.logger.info(f"Modified Accept header to: {new_value}")
-                            
-                            await session_manager.handle_request(scope, receive, send)
-                            return
-                        
-                        # 404 for other paths
-                        self.logger.info(f"Path not found: {path}")
-                        response = Response("Not Found", status_code=404)
-                        await response(scope, receive, send)
-                    except Exception as e:
-                        self.logger.error(f"Error handling request for {path}: {e}")
-                        import traceback
-                        self.logger.error(traceback.format_exc())
-                        response = Response("Internal Server Error", status_code=500)
-                        await response(scope, receive, send)
-                else:
-                    # For other scope types, just return
-                    self.logger.warning(f"Unsupported scope type: {scope['type']}")
+
+                # 404 for anything that is not /mcp or /mcp/...
+                if path != "/mcp" and not path.startswith("/mcp/"):
+                    if debug_enabled:
+                        self.logger.debug(f"Path not found: {path}")
+                    await send(_NOT_FOUND_START)
+                    await send(_NOT_FOUND_BODY)
                     return
-            
+
+                # Handle MCP requests - both /mcp and /mcp/ go to session manager
+                try:
+                    if debug_enabled:
+                        self.logger.debug(f"Handling MCP request for path: {path}")
+                    method = scope.get("method", "UNKNOWN")
+                    raw_headers = scope.get("headers", [])
+                    if debug_enabled:
+                        self.logger.debug(f"MCP Request - Method: {method}")
+                        self.logger.debug(f"MCP Request - Headers: {raw_headers}")
+
+                    # Handle Dify compatibility for GET requests
+                    # For GET requests, try to add application/json to Accept header
+                    # POST (tool calls) skips the header scan entirely
+                    if method == "GET":
+                        accept_idx = -1
+                        accept_val = b""
+                        for idx, (name, value) in enumerate(raw_headers):
+                            if name == b"accept":
+                                accept_idx = idx
+                                accept_val = value
+                        if b"text/event-stream" in accept_val and b"application/json" not in accept_val:
+                            # Only swap the accept tuple, leave the other headers untouched
+                            new_value = accept_val + b", application/json"
+                            new_headers = list(raw_headers)
+                            new_headers[accept_idx] = (b"accept", new_value)
+                            scope = {**scope, "headers": new_headers}
+                            if debug_enabled:
+                                self.logger.debug(f"Modified Accept header to: {new_value.decode('latin-1')}")
+
+                    await session_manager.handle_request(scope, receive, send)
+                except Exception as e:
+                    self.logger.exception(f"Error handling request for {path}: {e}")
+                    await send(_SERVER_ERROR_START)
+                    await send(_SERVER_ERROR_BODY)
+
+            # Session state lives in this process (stateless=False), so the
+            # MCP app cannot be spread across multiple worker processes
+            if workers > 1:
+                self.logger.warning(
+                    f"Requested {workers} workers, but stateful session manager requires a single worker process; using 1"
+                )
+
             # Start uvicorn server with session manager lifecycle
+            # httptools parses HTTP in C; serve() runs on the event loop started by main_sync,
+            # so uvicorn's loop/workers settings do not apply here
             config = uvicorn.Config(
                 app=mcp_app,
                 host=host,
                 port=port,
-                log_level="info"
+                log_level="info",
+                http="httptools",
+                access_log=False,
+                lifespan="on",
             )
             server = uvicorn.Server(config)
             
             # Run session manager and server together
-            async with session_manager.run():
-                self.logger.info("Session manager started, now starting HTTP server")
-                await server.serve()
+            try:
+                async with session_manager.run():
+                    self.logger.info("Session manager started, now starting HTTP server")
+                    await server.serve()
+            except* Exception as eg:
+                # Task group failures arrive as an ExceptionGroup, log each sub-exception with its stack
+                self.logger.error(f"Streamable HTTP server error: {len(eg.exceptions)} exception(s)")
+                for sub in eg.exceptions:
+                    self.logger.exception(f"Streamable HTTP sub-error: {type(sub).__name__}: {sub}", exc_info=sub)
+                # A bare raise here would wrap a lone failure in ExceptionGroup, re-raise it as itself
+                if len(eg.exceptions) == 1 and not isinstance(eg.exceptions[0], BaseExceptionGroup):
+                    raise eg.exceptions[0] from eg.exceptions[0].__cause__
+                raise
 
         except Exception as e:
-            self.logger.error(f"Streamable HTTP server startup failed: {e}")
-            import traceback
-            self.logger.error("Complete error stack:")
-            self.logger.error(traceback.format_exc())
-            
-            # If it's ExceptionGroup, try to parse
-            if hasattr(e, 'exceptions'):
-                self.logger.error(f"ExceptionGroup contains {len(e.exceptions)} exceptions:")
-                for i, exc in enumerate(e.exceptions):
-                    self.logger.error(f"  Exception {i+1}: {type(exc).__name__}: {exc}")
+            self.logger.exception(f"Streamable HTTP server startup failed: {e}")
             raise
 
     async def shutdown(self):
-        """Shutdown server"""
+        """Shutdown server, subsequent calls are a no-op"""
+        if self._closed:
+            return
+        self._closed = True
         self.logger.info("Shutting down Doris MCP Server")
         try:
             await self.connection_manager.close()
@@ -399,6 +452,7 @@ class DorisServer:
 
 def create_arg_parser():
     """Create command line argument parser"""
+    default_config = _get_default_config()
     parser = argparse.ArgumentParser(
         description="Apache Doris MCP Server - Enterprise Database Service",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -417,51 +471,68 @@ Examples:
         "--transport",
         type=str,
         choices=["stdio", "http"],
-        default=os.getenv("TRANSPORT", _default_config.transport),
-        help=f"Transport protocol type: stdio (local), http (Streamable HTTP) (default: {_default_config.transport})",
+        default=os.getenv("TRANSPORT", default_config.transport),
+        help=f"Transport protocol type: stdio (local), http (Streamable HTTP) (default: {default_config.transport})",
     )
 
     parser.add_argument(
         "--host",
         type=str,
-        default=os.getenv("SERVER_HOST", _default_config.database.host),
-        help=f"Host address for HTTP mode (default: {_default_config.database.host})",
+        default=os.getenv("SERVER_HOST", default_config.database.host),
+        help=f"Host address for HTTP mode (default: {default_config.database.host})",
     )
 
     parser.add_argument(
-        "--port", type=int, default=os.getenv("SERVER_PORT", _default_config.server_port), help=f"Port number for HTTP mode (default: {_default_config.server_port})"
+        "--port", type=int, default=os.getenv("SERVER_PORT", default_config.server_port), help=f"Port number for HTTP mode (default: {default_config.server_port})"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        choices=[1],
+        default=1,
+        help="Reserved: number of worker processes for HTTP mode, only 1 is accepted (default: 1). "
+        "The session manager keeps session state per process (stateless=False) and the app is served "
+        "in-process",
     )
 
     parser.add_argument(
         "--db-host",
         type=str,
-        default=os.getenv("DB_HOST", _default_config.database.host),
-        help=f"Doris database host address (default: {_default_config.database.host})",
+        default=os.getenv("DB_HOST", default_config.database.host),
+        help=f"Doris database host address (default: {default_config.database.host})",
     )
 
     parser.add_argument(
-        "--db-port", type=int, default=os.getenv("DB_PORT", _default_config.database.port), help=f"Doris database port number (default: {_default_config.database.port})"
+        "--db-port", type=int, default=os.getenv("DB_PORT", default_config.database.port), help=f"Doris database port number (default: {default_config.database.port})"
     )
 
     parser.add_argument(
-        "--db-user", type=str, default=os.getenv("DB_USER", _default_config.database.user), help=f"Doris database username (default: {_default_config.database.user})"
+        "--db-user", type=str, default=os.getenv("DB_USER", default_config.database.user), help=f"Doris database username (default: {default_config.database.user})"
     )
 
     parser.add_argument("--db-password", type=str, default="", help="Doris database password")
 
+    parser.add_argument(
+        "--db-pool-size",
+        type=_pool_size,
+        default=default_config.database.max_connections,
+        help=f"Maximum number of pooled Doris connections, each concurrent tool call uses its own, minimum 2 (default: {default_config.database.max_connections})",
+    )
+
     parser.add_argument(
         "--db-database",
         type=str,
-        default=os.getenv("DB_DATABASE", _default_config.database.database),
-        help=f"Doris database name (default: {_default_config.database.database})",
+        default=os.getenv("DB_DATABASE", default_config.database.database),
+        help=f"Doris database name (default: {default_config.database.database})",
     )
 
     parser.add_argument(
         "--log-level",
         type=str,
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-        default=os.getenv("LOG_LEVEL", _default_config.logging.level),
-        help=f"Log level (default: {_default_config.logging.level})",
+        default=os.getenv("LOG_LEVEL", default_config.logging.level),
+        help=f"Log level (default: {default_config.logging.level})",
     )
 
     return parser
@@ -479,18 +550,15 @@ async def main():
     config = DorisConfig.from_env()  # First load from .env file and environment variables
     
     # Command line arguments override configuration (if provided)
-    if args.db_host != _default_config.database.host:  # If not default value, use command line argument
-        config.database.host = args.db_host
-    if args.db_port != _default_config.database.port:
-        config.database.port = args.db_port
-    if args.db_user != _default_config.database.user:
-        config.database.user = args.db_user
+    default_config = _get_default_config()
+    for attr_path, arg_name in _ARG_SPECS:
+        value = getattr(args, arg_name)
+        if value != operator.attrgetter(attr_path)(default_config):  # If not default value, use command line argument
+            _set_config_value(config, attr_path, value)
     if args.db_password:  # Use password if provided
         config.database.password = args.db_password
-    if args.db_database != _default_config.database.database:
-        config.database.database = args.db_database
-    if args.log_level != _default_config.logging.level:
-        config.logging.level = args.log_level
+    # Pool size may have been lowered below the configured minimum
+    config.database.min_connections = min(config.database.min_connections, config.database.max_connections)
 
     # Create server instance
     server = DorisServer(config)
@@ -499,24 +567,18 @@ async def main():
         if args.transport == "stdio":
             await server.start_stdio()
         elif args.transport == "http":
-            await server.start_http(args.host, args.port)
+            await server.start_http(args.host, args.port, args.workers)
         else:
             logger.error(f"Unsupported transport protocol: {args.transport}")
-            await server.shutdown()
             return 1
 
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down server...")
     except Exception as e:
         logger.error(f"Server runtime error: {e}")
-        # Clean up resources even in case of exception
-        try:
-            await server.shutdown()
-        except Exception as shutdown_error:
-            logger.error(f"Error occurred while shutting down server: {shutdown_error}")
         return 1
     finally:
-        # Cleanup in case of normal shutdown
+        # Clean up resources on normal shutdown and in case of exception
         try:
             await server.shutdown()
         except Exception as shutdown_error:
@@ -525,9 +587,21 @@ async def main():
     return 0
 
 
+def _event_loop_factory():
+    """Return the uvloop loop factory when available (not supported on Windows)
+
+    None makes asyncio.run() fall back to the default asyncio event loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main_sync():
     """Synchronous main function for entry point"""
-    exit_code = asyncio.run(main())
+    exit_code = asyncio.run(main(), loop_factory=_event_loop_factory())
     exit(exit_code)
 
 
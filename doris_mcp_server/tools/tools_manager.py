@@ -24,6 +24,7 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List
 
+import orjson
 from mcp.types import Tool
 
 from ..utils.db import DorisConnectionManager
@@ -35,6 +36,17 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Tool results can hold many rows, serialize them with orjson (C) instead of stdlib json
+# Values orjson cannot encode natively (e.g. Decimal) fall back to str
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result, using stdlib json for what orjson rejects (e.g. ints wider than 64 bits)"""
+    try:
+        return orjson.dumps(obj, option=_JSON_OPTIONS, default=str).decode("utf-8")
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=str)
 
 
 class DorisToolsManager:
@@ -50,6 +62,26 @@ class DorisToolsManager:
         self.metadata_extractor = MetadataExtractor(connection_manager=connection_manager)
         self.monitoring_tools = DorisMonitoringTools(connection_manager)
         self.memory_tracker = MemoryTracker(connection_manager)
+
+        # Tool name -> routing method
+        self._tool_routes = {
+            "exec_query": self._exec_query_tool,
+            "get_table_schema": self._get_table_schema_tool,
+            "get_db_table_list": self._get_db_table_list_tool,
+            "get_db_list": self._get_db_list_tool,
+            "get_table_comment": self._get_table_comment_tool,
+            "get_table_column_comments": self._get_table_column_comments_tool,
+            "get_table_indexes": self._get_table_indexes_tool,
+            "get_recent_audit_logs": self._get_recent_audit_logs_tool,
+            "get_catalog_list": self._get_catalog_list_tool,
+            "get_sql_explain": self._get_sql_explain_tool,
+            "get_sql_profile": self._get_sql_profile_tool,
+            "get_table_data_size": self._get_table_data_size_tool,
+            "get_monitoring_metrics_info": self._get_monitoring_metrics_info_tool,
+            "get_monitoring_metrics_data": self._get_monitoring_metrics_data_tool,
+            "get_realtime_memory_stats": self._get_realtime_memory_stats_tool,
+            "get_historical_memory_stats": self._get_historical_memory_stats_tool,
+        }
         
         logger.info("DorisToolsManager initialized with business logic processors")
     
@@ -860,40 +892,13 @@ class DorisToolsManager:
             start_time = time.time()
             
             # Tool routing - dispatch requests to corresponding business logic processors
-            if name == "exec_query":
-                result = await self._exec_query_tool(arguments)
-            elif name == "get_table_schema":
-                result = await self._get_table_schema_tool(arguments)
-            elif name == "get_db_table_list":
-                result = await self._get_db_table_list_tool(arguments)
-            elif name == "get_db_list":
-                result = await self._get_db_list_tool(arguments)
-            elif name == "get_table_comment":
-                result = await self._get_table_comment_tool(arguments)
-            elif name == "get_table_column_comments":
-                result = await self._get_table_column_comments_tool(arguments)
-            elif name == "get_table_indexes":
-                result = await self._get_table_indexes_tool(arguments)
-            elif name == "get_recent_audit_logs":
-                result = await self._get_recent_audit_logs_tool(arguments)
-            elif name == "get_catalog_list":
-                result = await self._get_catalog_list_tool(arguments)
-            elif name == "get_sql_explain":
-                result = await self._get_sql_explain_tool(arguments)
-            elif name == "get_sql_profile":
-                result = await self._get_sql_profile_tool(arguments)
-            elif name == "get_table_data_size":
-                result = await self._get_table_data_size_tool(arguments)
-            elif name == "get_monitoring_metrics_info":
-                result = await self._get_monitoring_metrics_info_tool(arguments)
-            elif name == "get_monitoring_metrics_data":
-                result = await self._get_monitoring_metrics_data_tool(arguments)
-            elif name == "get_realtime_memory_stats":
-                result = await self._get_realtime_memory_stats_tool(arguments)
-            elif name == "get_historical_memory_stats":
-                result = await self._get_historical_memory_stats_tool(arguments)
-            else:
+            handler = self._tool_routes.get(name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {name}")
+
+            # Run the tool on its own pooled connection so concurrent calls don't share one
+            async with self.connection_manager.acquire():
+                result = await handler(arguments)
             
             execution_time = time.time() - start_time
             
@@ -905,7 +910,7 @@ class DorisToolsManager:
                     "timestamp": datetime.now().isoformat(),
                 }
             
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
             
         except Exception as e:
             logger.error(f"Tool call failed {name}: {str(e)}")
@@ -915,7 +920,7 @@ class DorisToolsManager:
                 "arguments": arguments,
                 "timestamp": datetime.now().isoformat(),
             }
-            return json.dumps(error_result, ensure_ascii=False, indent=2)
+            return _dumps(error_result)
     
     
     async def _exec_query_tool(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -26,6 +26,7 @@ import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List
@@ -34,6 +35,10 @@ import aiomysql
 from aiomysql import Connection, Pool
 
 
+# Pooled connection bound to the current task by DorisConnectionManager.acquire()
+_current_connection: ContextVar["DorisConnection | None"] = ContextVar(
+    "doris_current_connection", default=None
+)
 
 
 @dataclass
@@ -69,6 +74,7 @@ class DorisConnection:
         self.last_used = datetime.utcnow()
         self.query_count = 0
         self.is_healthy = True
+        self.session_state_changed = False
         self.security_manager = security_manager
 
     async def execute(self, sql: str, params: tuple | None = None, auth_context=None) -> QueryResult:
@@ -93,6 +99,9 @@ class DorisConnection:
 
                 # Check if it's a query statement (statement that returns result set)
                 sql_upper = sql.strip().upper()
+                if sql_upper.startswith(("USE", "SWITCH", "SET")):
+                    # Current catalog/database or session variables changed, connection must not go back to the pool as is
+                    self.session_state_changed = True
                 if (sql_upper.startswith("SELECT") or 
                     sql_upper.startswith("SHOW") or 
                     sql_upper.startswith("DESCRIBE") or 
@@ -129,6 +138,10 @@ class DorisConnection:
                     row_count=row_count,
                 )
 
+        except asyncio.CancelledError:
+            # Cancelled mid-query (e.g. asyncio.wait_for timeout), the result stream is left unread
+            self.is_healthy = False
+            raise
         except Exception as e:
             self.is_healthy = False
             logging.error(f"Query execution failed: {e}")
@@ -245,7 +258,12 @@ class DorisConnectionManager:
         """Get database connection
 
         Supports session-level connection reuse to improve performance and consistency
+        Inside an acquire() block the pooled connection bound to the current task is returned
         """
+        bound_conn = _current_connection.get()
+        if bound_conn is not None:
+            return bound_conn
+
         # Check if there's an existing session connection
         if session_id in self.session_connections:
             conn = self.session_connections[session_id]
@@ -299,6 +317,39 @@ class DorisConnectionManager:
             self.logger.error(f"Failed to create connection for session {session_id}: {e}")
             raise
 
+    @asynccontextmanager
+    async def acquire(self):
+        """Acquire a dedicated pooled connection for the current task
+
+        While the block is active, get_connection() calls made from this task (and tasks it
+        spawns) share this connection instead of the session-level ones, so concurrent tool
+        calls run on separate connections. Nested acquire() calls reuse the outer connection.
+        """
+        bound_conn = _current_connection.get()
+        if bound_conn is not None:
+            yield bound_conn
+            return
+
+        if not self.pool:
+            raise RuntimeError("Connection pool not initialized")
+
+        raw_connection = await self.pool.acquire()
+        doris_conn = DorisConnection(raw_connection, f"pooled_{id(raw_connection)}", self.security_manager)
+        token = _current_connection.set(doris_conn)
+        try:
+            yield doris_conn
+        except BaseException:
+            # Errors, timeouts and cancellation may leave a query running on the connection,
+            # never hand it back to the pool in that state
+            raw_connection.close()
+            raise
+        finally:
+            _current_connection.reset(token)
+            # Drop connections that failed or changed catalog/database or session variables instead of reusing them
+            if not raw_connection.closed and (not doris_conn.is_healthy or doris_conn.session_state_changed):
+                raw_connection.close()
+            self.pool.release(raw_connection)
+
     async def release_connection(self, session_id: str):
         """Release session connection"""
         if session_id in self.session_connections:
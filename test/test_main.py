@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Server entry point tests
+"""
+
+import argparse
+import json
+import logging
+from contextlib import asynccontextmanager
+
+import pytest
+from mcp import types
+from pydantic import AnyUrl
+from unittest.mock import AsyncMock, Mock, patch
+
+from doris_mcp_server.main import (
+    DorisServer,
+    _err_prompt,
+    _err_resource,
+    _err_tool,
+    create_arg_parser,
+    main,
+)
+from doris_mcp_server.tools.prompts_manager import DorisPromptsManager
+from doris_mcp_server.tools.resources_manager import DorisResourcesManager
+from doris_mcp_server.tools.tools_manager import DorisToolsManager
+from doris_mcp_server.utils.config import DorisConfig
+
+
+class TestArgParser:
+    """Command line argument tests"""
+
+    @pytest.mark.parametrize(("env_name", "arg_name"), [("SERVER_PORT", "port"), ("DB_PORT", "db_port")])
+    def test_port_from_env(self, monkeypatch, env_name, arg_name):
+        """Test port defaults are read from the environment and parsed as int"""
+        monkeypatch.setenv(env_name, "4000")
+        args = create_arg_parser().parse_args([])
+        assert getattr(args, arg_name) == 4000
+
+    @pytest.mark.parametrize("env_name", ["SERVER_PORT", "DB_PORT"])
+    def test_invalid_port_from_env(self, monkeypatch, env_name):
+        """Test a non-numeric port in the environment is reported as an argument error"""
+        monkeypatch.setenv(env_name, "abc")
+        parser = create_arg_parser()
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args([])
+        assert exc_info.value.code == 2
+
+    @pytest.mark.parametrize("value", ["-1", "0", "2"])
+    def test_workers_rejects_values_other_than_one(self, value):
+        """Test --workers only accepts 1 while the session manager is stateful"""
+        with pytest.raises(SystemExit):
+            create_arg_parser().parse_args(["--workers", value])
+        assert create_arg_parser().parse_args(["--workers", "1"]).workers == 1
+
+    def test_db_pool_size(self):
+        """Test a valid pool size is parsed as int"""
+        args = create_arg_parser().parse_args(["--db-pool-size", "2"])
+        assert args.db_pool_size == 2
+
+    @pytest.mark.parametrize("value", ["-1", "0", "1", "abc"])
+    def test_db_pool_size_rejects_invalid_values(self, value):
+        """Test pool sizes below 2 are rejected"""
+        with pytest.raises(SystemExit):
+            create_arg_parser().parse_args(["--db-pool-size", value])
+
+
+class TestMainConfig:
+    """Command line override of environment configuration tests"""
+
+    @pytest.fixture
+    def env_config(self, monkeypatch):
+        """Create configuration as loaded from the environment, with no parser env defaults set"""
+        for name in ("TRANSPORT", "SERVER_HOST", "SERVER_PORT", "DB_HOST", "DB_PORT", "DB_USER", "DB_DATABASE", "LOG_LEVEL"):
+            monkeypatch.delenv(name, raising=False)
+        config = DorisConfig()
+        config.database.host = "env-host"
+        config.database.port = 9031
+        config.database.user = "env_user"
+        config.database.database = "env_db"
+        config.database.min_connections = 5
+        config.database.max_connections = 30
+        # main() sets the root log level from --log-level
+        root_level = logging.getLogger().level
+        yield config
+        logging.getLogger().setLevel(root_level)
+
+    async def _run_main(self, env_config, *argv):
+        """Run main() in stdio mode and return the configuration the server was built with"""
+        with (
+            patch("sys.argv", ["doris-mcp-server", "--transport", "stdio", *argv]),
+            patch.object(DorisConfig, "from_env", return_value=env_config),
+            patch("doris_mcp_server.main.DorisServer") as server_cls,
+        ):
+            server_cls.return_value.start_stdio = AsyncMock()
+            server_cls.return_value.shutdown = AsyncMock()
+            assert await main() == 0
+        return server_cls.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_default_arguments_keep_env_config(self, env_config):
+        """Test default CLI values leave environment derived values alone"""
+        config = await self._run_main(env_config)
+
+        assert config.database.host == "env-host"
+        assert config.database.port == 9031
+        assert config.database.user == "env_user"
+        assert config.database.database == "env_db"
+        assert config.database.max_connections == 30
+        assert config.database.min_connections == 5
+
+    @pytest.mark.asyncio
+    async def test_cli_arguments_override_env_config(self, env_config):
+        """Test non-default CLI values override environment derived values"""
+        config = await self._run_main(
+            env_config,
+            "--db-host", "cli-host",
+            "--db-port", "9032",
+            "--db-user", "cli_user",
+            "--db-password", "secret",
+            "--db-database", "cli_db",
+            "--db-pool-size", "10",
+            "--log-level", "DEBUG",
+        )
+
+        assert config.database.host == "cli-host"
+        assert config.database.port == 9032
+        assert config.database.user == "cli_user"
+        assert config.database.password == "secret"
+        assert config.database.database == "cli_db"
+        assert config.database.max_connections == 10
+        assert config.database.min_connections == 5
+        assert config.logging.level == "DEBUG"
+
+    @pytest.mark.asyncio
+    async def test_small_pool_size_clamps_min_connections(self, env_config):
+        """Test a pool size below the configured minimum lowers min_connections"""
+        config = await self._run_main(env_config, "--db-pool-size", "2")
+
+        assert config.database.max_connections == 2
+        assert config.database.min_connections == 2
+
+
+class TestInitializationOptions:
+    """Initialization options tests"""
+
+    def test_http_sessions_use_cached_options(self):
+        """Test the session manager hook returns the options built in __init__"""
+        doris_server = DorisServer(DorisConfig())
+
+        options = doris_server.server.create_initialization_options()
+
+        assert options is doris_server._init_options
+        assert options is doris_server.server.create_initialization_options()
+        assert options.capabilities.tools.listChanged
+        assert options.capabilities.resources.listChanged
+        assert options.capabilities.prompts.listChanged
+
+
+class TestShutdown:
+    """Server shutdown tests"""
+
+    @pytest.mark.asyncio
+    async def test_shutdown_is_idempotent(self):
+        """Test repeated shutdown() closes the connection manager once"""
+        doris_server = DorisServer(DorisConfig())
+        doris_server.connection_manager.close = AsyncMock()
+
+        await doris_server.shutdown()
+        await doris_server.shutdown()
+
+        doris_server.connection_manager.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unsupported_transport_shuts_down_once(self):
+        """Test the unsupported transport path returns 1 and cleans up only in finally"""
+        args = create_arg_parser().parse_args([])
+        args.transport = "websocket"
+        parser = Mock(spec=argparse.ArgumentParser)
+        parser.parse_args.return_value = args
+        root_level = logging.getLogger().level
+
+        with (
+            patch("doris_mcp_server.main.create_arg_parser", return_value=parser),
+            patch.object(DorisConfig, "from_env", return_value=DorisConfig()),
+            patch("doris_mcp_server.main.DorisServer") as server_cls,
+        ):
+            server_cls.return_value.shutdown = AsyncMock()
+            assert await main() == 1
+
+        logging.getLogger().setLevel(root_level)
+        server_cls.return_value.shutdown.assert_awaited_once()
+
+
+class TestErrorTemplates:
+    """JSON error template tests"""
+
+    def test_err_resource_with_any_url(self):
+        """Test resource errors serialize a pydantic AnyUrl URI"""
+        error = json.loads(_err_resource('bad "quoted"\nmessage', AnyUrl("doris://table/t")))
+        assert error == {"error": 'bad "quoted"\nmessage', "uri": "doris://table/t"}
+
+    def test_err_tool(self):
+        """Test tool errors serialize nested and non-string arguments"""
+        arguments = {"sql": "SELECT '\u4e2d'", "limit": 10, "options": {1: None}}
+        error = json.loads(_err_tool("failed", "exec_query", arguments))
+        assert error == {
+            "error": "failed",
+            "tool_name": "exec_query",
+            "arguments": {"sql": "SELECT '\u4e2d'", "limit": 10, "options": {"1": None}},
+        }
+
+    def test_err_tool_with_big_int_arguments(self):
+        """Test tool errors serialize ints wider than 64 bits"""
+        error = json.loads(_err_tool("failed", "exec_query", {"id": 2**64, "name": "张三"}))
+        assert error["arguments"] == {"id": 2**64, "name": "张三"}
+
+    def test_err_tool_without_arguments(self):
+        """Test tool errors serialize missing arguments as null"""
+        assert json.loads(_err_tool("failed", "exec_query", None))["arguments"] is None
+
+    def test_err_prompt_without_arguments(self):
+        """Test prompt errors serialize missing arguments as null"""
+        error = json.loads(_err_prompt("failed", "data_analysis", None))
+        assert error == {"error": "failed", "prompt_name": "data_analysis", "arguments": None}
+
+
+class TestStdioErrors:
+    """stdio transport error propagation tests"""
+
+    @pytest.fixture
+    def doris_server(self):
+        """Create server whose stdio transport yields dummy streams"""
+        server = DorisServer(DorisConfig())
+        server.connection_manager.initialize = AsyncMock()
+
+        @asynccontextmanager
+        async def stdio_server():
+            yield Mock(), Mock()
+
+        with patch("mcp.server.stdio.stdio_server", stdio_server):
+            yield server
+
+    @pytest.mark.asyncio
+    async def test_single_error_is_not_wrapped(self, doris_server):
+        """Test a lone failure is re-raised as itself"""
+        doris_server.server.run = AsyncMock(side_effect=ValueError("boom"))
+
+        with pytest.raises(ValueError, match="boom"):
+            await doris_server.start_stdio()
+
+    @pytest.mark.asyncio
+    async def test_exception_group_is_preserved(self, doris_server):
+        """Test task group failures are re-raised as the original group"""
+        error = ExceptionGroup("task group failed", [ValueError("a"), KeyError("b")])
+        doris_server.server.run = AsyncMock(side_effect=error)
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            await doris_server.start_stdio()
+        assert len(exc_info.value.exceptions) == 2
+
+
+class TestMcpHandlers:
+    """Registered MCP request handler tests"""
+
+    URI = "doris://table/test_table"
+
+    def _handler(self, doris_server, request_type):
+        return doris_server.server.request_handlers[request_type]
+
+    def _read_request(self):
+        return types.ReadResourceRequest(
+            method="resources/read", params=types.ReadResourceRequestParams(uri=self.URI)
+        )
+
+    def _call_tool_request(self):
+        return types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="exec_query", arguments={"sql": "SELECT 1"}),
+        )
+
+    def _get_prompt_request(self, arguments=None):
+        return types.GetPromptRequest(
+            method="prompts/get",
+            params=types.GetPromptRequestParams(name="data_analysis", arguments=arguments),
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_resources(self):
+        """Test resource list success path"""
+        resource = types.Resource(uri=self.URI, name="test_table")
+        with patch.object(DorisResourcesManager, "list_resources", AsyncMock(return_value=[resource])):
+            doris_server = DorisServer(DorisConfig())
+
+        result = await self._handler(doris_server, types.ListResourcesRequest)(
+            types.ListResourcesRequest(method="resources/list")
+        )
+        assert result.root.resources == [resource]
+
+    @pytest.mark.asyncio
+    async def test_list_resources_error(self):
+        """Test resource list falls back to an empty list"""
+        with patch.object(DorisResourcesManager, "list_resources", AsyncMock(side_effect=RuntimeError("down"))):
+            doris_server = DorisServer(DorisConfig())
+
+        result = await self._handler(doris_server, types.ListResourcesRequest)(
+            types.ListResourcesRequest(method="resources/list")
+        )
+        assert result.root.resources == []
+
+    @pytest.mark.asyncio
+    async def test_read_resource(self):
+        """Test resource read success path"""
+        with patch.object(DorisResourcesManager, "read_resource", AsyncMock(return_value='{"table": "t"}')):
+            doris_server = DorisServer(DorisConfig())
+
+        with pytest.warns(DeprecationWarning):
+            result = await self._handler(doris_server, types.ReadResourceRequest)(self._read_request())
+        assert result.root.contents[0].text == '{"table": "t"}'
+
+    @pytest.mark.asyncio
+    async def test_read_resource_error(self):
+        """Test resource read falls back to a JSON error carrying the URI"""
+        with patch.object(DorisResourcesManager, "read_resource", AsyncMock(side_effect=RuntimeError("down"))):
+            doris_server = DorisServer(DorisConfig())
+
+        with pytest.warns(DeprecationWarning):
+            result = await self._handler(doris_server, types.ReadResourceRequest)(self._read_request())
+        error = json.loads(result.root.contents[0].text)
+        assert error == {"error": "Failed to read resource: down", "uri": self.URI}
+
+    @pytest.mark.asyncio
+    async def test_list_tools(self):
+        """Test tool list success path"""
+        tool = types.Tool(name="exec_query", inputSchema={"type": "object"})
+        with patch.object(DorisToolsManager, "list_tools", AsyncMock(return_value=[tool])):
+            doris_server = DorisServer(DorisConfig())
+
+        result = await self._handler(doris_server, types.ListToolsRequest)(
+            types.ListToolsRequest(method="tools/list")
+        )
+        assert result.root.tools == [tool]
+
+    @pytest.mark.asyncio
+    async def test_list_tools_error(self):
+        """Test tool list falls back to an empty list"""
+        with patch.object(DorisToolsManager, "list_tools", AsyncMock(side_effect=RuntimeError("down"))):
+            doris_server = DorisServer(DorisConfig())
+
+        result = await self._handler(doris_server, types.ListToolsRequest)(
+            types.ListToolsRequest(method="tools/list")
+        )
+        assert result.root.tools == []
+
+    @pytest.mark.asyncio
+    async def test_call_tool(self):
+        """Test tool call wraps the manager result as text content"""
+        doris_server = DorisServer(DorisConfig())
+        doris_server.tools_manager.call_tool = AsyncMock(return_value='{"success": true}')
+
+        result = await self._handler(doris_server, types.CallToolRequest)(self._call_tool_request())
+        assert not result.root.isError
+        assert result.root.content[0].text == '{"success": true}'
+        doris_server.tools_manager.call_tool.assert_awaited_once_with("exec_query", {"sql": "SELECT 1"})
+
+    @pytest.mark.asyncio
+    async def test_call_tool_error(self):
+        """Test tool call falls back to a JSON error with the request details"""
+        doris_server = DorisServer(DorisConfig())
+        doris_server.tools_manager.call_tool = AsyncMock(side_effect=RuntimeError("down"))
+
+        result = await self._handler(doris_server, types.CallToolRequest)(self._call_tool_request())
+        error = json.loads(result.root.content[0].text)
+        assert error == {
+            "error": "Tool call failed: down",
+            "tool_name": "exec_query",
+            "arguments": {"sql": "SELECT 1"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_list_prompts(self):
+        """Test prompt list success path"""
+        prompt = types.Prompt(name="data_analysis")
+        with patch.object(DorisPromptsManager, "list_prompts", AsyncMock(return_value=[prompt])):
+            doris_server = DorisServer(DorisConfig())
+
+        result = await self._handler(doris_server, types.ListPromptsRequest)(
+            types.ListPromptsRequest(method="prompts/list")
+        )
+        assert result.root.prompts == [prompt]
+
+    @pytest.mark.asyncio
+    async def test_list_prompts_error(self):
+        """Test prompt list falls back to an empty list"""
+        with patch.object(DorisPromptsManager, "list_prompts", AsyncMock(side_effect=RuntimeError("down"))):
+            doris_server = DorisServer(DorisConfig())
+
+        result = await self._handler(doris_server, types.ListPromptsRequest)(
+            types.ListPromptsRequest(method="prompts/list")
+        )
+        assert result.root.prompts == []
+
+    @pytest.mark.asyncio
+    async def test_get_prompt(self):
+        """Test prompt get success path"""
+        prompt = types.GetPromptResult(
+            messages=[types.PromptMessage(role="user", content=types.TextContent(type="text", text="analyze"))]
+        )
+        with patch.object(DorisPromptsManager, "get_prompt", AsyncMock(return_value=prompt)):
+            doris_server = DorisServer(DorisConfig())
+
+        result = await self._handler(doris_server, types.GetPromptRequest)(
+            self._get_prompt_request({"table_name": "t"})
+        )
+        assert result.root == prompt
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("arguments", [None, {"table_name": "t"}])
+    async def test_get_prompt_error(self, arguments):
+        """Test prompt get falls back to a prompt message holding a JSON error"""
+        with patch.object(DorisPromptsManager, "get_prompt", AsyncMock(side_effect=ValueError("missing"))):
+            doris_server = DorisServer(DorisConfig())
+
+        result = await self._handler(doris_server, types.GetPromptRequest)(self._get_prompt_request(arguments))
+        error = json.loads(result.root.messages[0].content.text)
+        assert error == {
+            "error": "Failed to get prompt: missing",
+            "prompt_name": "data_analysis",
+            "arguments": arguments,
+        }
@@ -65,6 +65,7 @@ class TestDorisToolsManager:
         # Create a proper mock connection manager
         mock_connection_manager = Mock()
         mock_connection_manager.get_connection = AsyncMock()
+        mock_connection_manager.acquire = Mock(return_value=AsyncMock())
         return DorisToolsManager(mock_connection_manager)
 
     @pytest.mark.asyncio
@@ -135,6 +136,30 @@ class TestDorisToolsManager:
                 assert any(keyword in result_data["error"].lower() for keyword in 
                           ["connection", "failed", "error", "mock"])
 
+    @pytest.mark.asyncio
+    async def test_call_tool_result_with_big_int(self, tools_manager):
+        """Test results holding ints wider than 64 bits still serialize"""
+        tools_manager._tool_routes["exec_query"] = AsyncMock(
+            return_value={"success": True, "data": [{"id": 2**70, "name": "张三"}]}
+        )
+
+        result = await tools_manager.call_tool("exec_query", {"sql": "SELECT 1"})
+        result_data = json.loads(result)
+
+        assert result_data["data"] == [{"id": 2**70, "name": "张三"}]
+        assert "张三" in result
+
+    @pytest.mark.asyncio
+    async def test_call_tool_error_with_big_int_arguments(self, tools_manager):
+        """Test the error result serializes arguments holding ints wider than 64 bits"""
+        tools_manager._tool_routes["exec_query"] = AsyncMock(side_effect=Exception("Query failed"))
+
+        result = await tools_manager.call_tool("exec_query", {"sql": "SELECT 1", "id": 2**64})
+        result_data = json.loads(result)
+
+        assert result_data["error"] == "Query failed"
+        assert result_data["arguments"] == {"sql": "SELECT 1", "id": 2**64}
+
     @pytest.mark.asyncio
     async def test_get_db_list_tool(self, tools_manager):
         """Test get_db_list tool"""
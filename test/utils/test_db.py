@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Database connection manager tests
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from doris_mcp_server.utils.config import DorisConfig
+from doris_mcp_server.utils.db import DorisConnectionManager
+
+
+class TestDorisConnectionManagerAcquire:
+    """Pooled connection acquire/release tests"""
+
+    def _raw_connection(self):
+        """Create a mock aiomysql connection whose close() marks it closed"""
+        raw = Mock()
+        raw.closed = False
+
+        def close():
+            raw.closed = True
+
+        raw.close = Mock(side_effect=close)
+
+        cursor = AsyncMock()
+        cursor.description = None
+        cursor.rowcount = 0
+        cursor_context = MagicMock()
+        cursor_context.__aenter__.return_value = cursor
+        raw.cursor = Mock(return_value=cursor_context)
+        return raw
+
+    @pytest.fixture
+    def connection_manager(self):
+        """Create connection manager with a mock pool"""
+        manager = DorisConnectionManager(DorisConfig())
+        manager.pool = Mock()
+        manager.pool.acquire = AsyncMock(side_effect=lambda: self._raw_connection())
+        manager.pool.release = Mock()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_acquire_releases_connection_to_pool(self, connection_manager):
+        """Test a clean block returns the open connection to the pool"""
+        async with connection_manager.acquire() as conn:
+            raw = conn.connection
+
+        connection_manager.pool.release.assert_called_once_with(raw)
+        raw.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_nested_acquire_reuses_connection(self, connection_manager):
+        """Test nested acquire() reuses the outer connection"""
+        async with connection_manager.acquire() as outer:
+            async with connection_manager.acquire() as inner:
+                assert inner is outer
+
+        connection_manager.pool.acquire.assert_awaited_once()
+        connection_manager.pool.release.assert_called_once_with(outer.connection)
+
+    @pytest.mark.asyncio
+    async def test_get_connection_returns_bound_connection(self, connection_manager):
+        """Test get_connection() returns the task-bound connection inside acquire()"""
+        async with connection_manager.acquire() as conn:
+            assert await connection_manager.get_connection("system") is conn
+            assert await connection_manager.get_connection("query") is conn
+
+        assert connection_manager.session_connections == {}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "USE test_db",
+            "use `internal`.`test_db`",
+            "SWITCH hive_catalog",
+            'set session_context="trace_id:abc"',
+            "SET enable_profile=true",
+        ],
+    )
+    async def test_connection_closed_after_session_state_change(self, connection_manager, sql):
+        """Test connections that ran USE/SWITCH/SET are not reused"""
+        async with connection_manager.acquire() as conn:
+            await conn.execute(sql)
+            raw = conn.connection
+
+        raw.close.assert_called_once()
+        connection_manager.pool.release.assert_called_once_with(raw)
+
+    @pytest.mark.asyncio
+    async def test_connection_closed_after_error(self, connection_manager):
+        """Test an exception leaving the block closes the connection"""
+        with pytest.raises(ValueError):
+            async with connection_manager.acquire() as conn:
+                raw = conn.connection
+                raise ValueError("boom")
+
+        raw.close.assert_called_once()
+        connection_manager.pool.release.assert_called_once_with(raw)
+
+    @pytest.mark.asyncio
+    async def test_connection_closed_after_cancel(self, connection_manager):
+        """Test cancellation leaving the block closes the connection"""
+        with pytest.raises(asyncio.CancelledError):
+            async with connection_manager.acquire() as conn:
+                raw = conn.connection
+                raise asyncio.CancelledError()
+
+        raw.close.assert_called_once()
+        connection_manager.pool.release.assert_called_once_with(raw)
+
+    @pytest.mark.asyncio
+    async def test_connection_closed_after_query_timeout(self, connection_manager):
+        """Test a query cancelled by a timeout that is handled inside the block still closes the connection"""
+        async with connection_manager.acquire() as conn:
+            raw = conn.connection
+            cursor = raw.cursor.return_value.__aenter__.return_value
+
+            async def slow_query(*args):
+                await asyncio.sleep(1)
+
+            cursor.execute.side_effect = slow_query
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(conn.execute("SELECT SLEEP(1)"), timeout=0.01)
+
+        assert not conn.is_healthy
+        raw.close.assert_called_once()
+        connection_manager.pool.release.assert_called_once_with(raw)
+
+    @pytest.mark.asyncio
+    async def test_acquire_requires_initialized_pool(self):
+        """Test acquire() fails when the pool was not initialized"""
+        manager = DorisConnectionManager(DorisConfig())
+
+        with pytest.raises(RuntimeError):
+            async with manager.acquire():
+                pass